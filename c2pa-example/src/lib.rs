@@ -18,7 +18,8 @@ use std::os::raw::c_char;
 use cimpl::{
     box_tracked, cimpl_free, cstr_or_return, cstr_or_return_null,
     deref_or_return_neg, deref_or_return_null, deref_mut_or_return_neg,
-    ok_or_return, ok_or_return_null, option_to_c_string, to_c_string, CimplError,
+    ok_or_return, ok_or_return_null, option_to_c_string, to_c_string, to_c_string_with_len,
+    CimplError,
 };
 
 // ============================================================================
@@ -294,14 +295,84 @@ pub extern "C" fn c2pa_settings_to_toml(settings: *mut C2paSettings) -> *mut c_c
     to_c_string(toml)
 }
 
+/// Serialize Settings to JSON string, reporting its length
+///
+/// Same as `c2pa_settings_to_json`, but also writes the byte length of the
+/// returned string (excluding the NUL terminator) to `out_len`, so callers
+/// can copy the result without scanning for the terminator.
+///
+/// Returns NULL on error. Caller must free with c2pa_free().
+///
+/// # Example
+/// ```c
+/// size_t len = 0;
+/// char* json = c2pa_settings_to_json_len(settings, &len);
+/// fwrite(json, 1, len, stdout);
+/// c2pa_free(json);
+/// ```
+#[no_mangle]
+pub extern "C" fn c2pa_settings_to_json_len(
+    settings: *mut C2paSettings,
+    out_len: *mut usize,
+) -> *mut c_char {
+    let settings_ref = deref_or_return_null!(settings, C2paSettings);
+    let json = ok_or_return_null!(
+        serde_json::to_string_pretty(&settings_ref.inner).map_err(C2paInternalError::Json)
+    );
+    to_c_string_with_len(json, out_len)
+}
+
+/// Serialize Settings to compact JSON, reporting its length
+///
+/// Produces the same document as `c2pa_settings_to_json_len` without the
+/// pretty-printing whitespace. Use this when the JSON is going straight into
+/// a parser rather than being shown to a person.
+///
+/// Returns NULL on error. Caller must free with c2pa_free().
+#[no_mangle]
+pub extern "C" fn c2pa_settings_to_json_compact(
+    settings: *mut C2paSettings,
+    out_len: *mut usize,
+) -> *mut c_char {
+    let settings_ref = deref_or_return_null!(settings, C2paSettings);
+    let json = ok_or_return_null!(
+        serde_json::to_string(&settings_ref.inner).map_err(C2paInternalError::Json)
+    );
+    to_c_string_with_len(json, out_len)
+}
+
+/// Serialize Settings to TOML string, reporting its length
+///
+/// Same as `c2pa_settings_to_toml`, but also writes the byte length of the
+/// returned string (excluding the NUL terminator) to `out_len`.
+///
+/// Returns NULL on error. Caller must free with c2pa_free().
+#[no_mangle]
+pub extern "C" fn c2pa_settings_to_toml_len(
+    settings: *mut C2paSettings,
+    out_len: *mut usize,
+) -> *mut c_char {
+    let settings_ref = deref_or_return_null!(settings, C2paSettings);
+    let toml = ok_or_return_null!(
+        toml::to_string_pretty(&settings_ref.inner)
+            .map_err(|e| C2paInternalError::Other(format!("{}", e)))
+    );
+    to_c_string_with_len(toml, out_len)
+}
+
 /// Apply Settings to a Context (builder-style, mutates Context in place)
 ///
 /// This configures the Context with the given Settings.
 /// Returns 0 on success, non-zero on error.
 ///
+/// The Settings are copied, not parsed, so this is the cheap way to configure
+/// many Contexts the same way: parse the JSON/TOML once into a `C2paSettings`
+/// and apply it to each Context, rather than passing the same string to
+/// `c2pa_context_with_settings` every time.
+///
 /// # Parameters
 /// - `ctx`: Context to modify
-/// - `settings`: Settings to apply
+/// - `settings`: Settings to apply (still owned by the caller)
 #[no_mangle]
 pub extern "C" fn c2pa_context_with_settings_obj(
     ctx: *mut C2paContext,
@@ -2,22 +2,47 @@
 Python bindings for cimpl reference example - Secret Message Processor
 
 This demonstrates idiomatic Python error handling for cimpl FFI.
+
+Text arguments may be given as str or as UTF-8 encoded bytes; bytes are
+passed to the library as-is, skipping the encode step.
 """
 
 import ctypes
 import os
+import sys
 from pathlib import Path
+from typing import Union
 
-# Find the library
-lib_path = Path(__file__).parent.parent.parent / "target" / "release"
-if os.name == 'nt':
+# Find the library: the file name is fixed per platform, so probe each
+# build directory for it rather than trying every name with dlopen
+if sys.platform == 'win32':
     lib_name = "cimpl_reference.dll"
-elif os.uname().sysname == 'Darwin':
+elif sys.platform == 'darwin':
     lib_name = "libcimpl_reference.dylib"
 else:
     lib_name = "libcimpl_reference.so"
 
-lib = ctypes.CDLL(str(lib_path / lib_name))
+# CIMPL_REFERENCE_LIB, when set by the user, names the library to load and
+# skips the probing. It is only read, never written.
+lib_file = os.environ.get('CIMPL_REFERENCE_LIB')
+if not lib_file or not os.path.isfile(lib_file):
+    _target_dir = Path(__file__).parent.parent.parent / "target"
+    for _profile_dir in (_target_dir / "release", _target_dir / "debug"):
+        if (_profile_dir / lib_name).exists():
+            break
+    else:
+        raise FileNotFoundError(
+            f"{lib_name} not found in {_target_dir}/release or {_target_dir}/debug. "
+            f"Build it with: cargo build --release"
+        )
+    lib_file = str((_profile_dir / lib_name).resolve())
+
+# Directory the library is loaded from
+lib_path = Path(lib_file).parent
+
+# Default RTLD_LOCAL: the stream library also exports cimpl_free, and a global
+# load would let one library's calls resolve to the other's copy
+lib = ctypes.CDLL(lib_file)
 
 # ============================================================================
 # Error Handling
@@ -32,6 +57,7 @@ class SecretError(Exception):
 
 # Error codes
 SECRET_ERROR_OK = 0
+SECRET_ERROR_NULL_PARAMETER = 1
 SECRET_ERROR_INVALID_HEX = 100
 SECRET_ERROR_INVALID_FORMAT = 101
 SECRET_ERROR_TOO_SHORT = 102
@@ -41,153 +67,190 @@ SECRET_ERROR_TOO_LONG = 103
 # Function Signatures
 # ============================================================================
 
-# String → String functions
-lib.secret_rot13.argtypes = [ctypes.c_char_p]
-lib.secret_rot13.restype = ctypes.c_void_p
-
-lib.secret_reverse.argtypes = [ctypes.c_char_p]
-lib.secret_reverse.restype = ctypes.c_void_p
-
-lib.secret_remove_vowels.argtypes = [ctypes.c_char_p]
-lib.secret_remove_vowels.restype = ctypes.c_void_p
-
-lib.secret_uppercase.argtypes = [ctypes.c_char_p]
-lib.secret_uppercase.restype = ctypes.c_void_p
-
-lib.secret_to_hex.argtypes = [ctypes.c_char_p]
-lib.secret_to_hex.restype = ctypes.c_void_p
-
-lib.secret_from_hex.argtypes = [ctypes.c_char_p]
-lib.secret_from_hex.restype = ctypes.c_void_p
-
-# Validation functions
-lib.secret_validate_length.argtypes = [ctypes.c_char_p, ctypes.c_size_t, ctypes.c_size_t]
-lib.secret_validate_length.restype = ctypes.c_bool
-
-lib.secret_is_ascii.argtypes = [ctypes.c_char_p]
-lib.secret_is_ascii.restype = ctypes.c_bool
-
-lib.secret_is_valid_hex.argtypes = [ctypes.c_char_p]
-lib.secret_is_valid_hex.restype = ctypes.c_bool
-
-# Counting functions
-lib.secret_count_chars.argtypes = [ctypes.c_char_p]
-lib.secret_count_chars.restype = ctypes.c_size_t
-
-lib.secret_count_vowels.argtypes = [ctypes.c_char_p]
-lib.secret_count_vowels.restype = ctypes.c_size_t
+# name: (argtypes, restype) - the single source of truth for the C API
+_SIGNATURES = {
+    # String → String functions
+    'secret_rot13': ((ctypes.c_char_p,), ctypes.c_void_p),
+    'secret_reverse': ((ctypes.c_char_p,), ctypes.c_void_p),
+    'secret_remove_vowels': ((ctypes.c_char_p,), ctypes.c_void_p),
+    'secret_uppercase': ((ctypes.c_char_p,), ctypes.c_void_p),
+    'secret_to_hex': ((ctypes.c_char_p,), ctypes.c_void_p),
+    'secret_from_hex': ((ctypes.c_char_p,), ctypes.c_void_p),
+
+    # String → String functions that also report the result length
+    'secret_rot13_len': ((ctypes.c_char_p, ctypes.POINTER(ctypes.c_size_t)), ctypes.c_void_p),
+    'secret_reverse_len': ((ctypes.c_char_p, ctypes.POINTER(ctypes.c_size_t)), ctypes.c_void_p),
+    'secret_remove_vowels_len': ((ctypes.c_char_p, ctypes.POINTER(ctypes.c_size_t)), ctypes.c_void_p),
+    'secret_uppercase_len': ((ctypes.c_char_p, ctypes.POINTER(ctypes.c_size_t)), ctypes.c_void_p),
+    'secret_to_hex_len': ((ctypes.c_char_p, ctypes.POINTER(ctypes.c_size_t)), ctypes.c_void_p),
+    'secret_from_hex_len': ((ctypes.c_char_p, ctypes.POINTER(ctypes.c_size_t)), ctypes.c_void_p),
+
+    # Validation functions
+    'secret_validate_length': ((ctypes.c_char_p, ctypes.c_size_t, ctypes.c_size_t), ctypes.c_bool),
+    'secret_is_ascii': ((ctypes.c_char_p,), ctypes.c_bool),
+    'secret_is_valid_hex': ((ctypes.c_char_p,), ctypes.c_bool),
+
+    # Counting functions
+    'secret_count_chars': ((ctypes.c_char_p,), ctypes.c_size_t),
+    'secret_count_vowels': ((ctypes.c_char_p,), ctypes.c_size_t),
+    'secret_count_vowels_batch': (
+        (ctypes.POINTER(ctypes.c_char_p), ctypes.POINTER(ctypes.c_size_t),
+         ctypes.c_size_t, ctypes.POINTER(ctypes.c_size_t)),
+        ctypes.c_bool,
+    ),
+    'secret_count_consonants': ((ctypes.c_char_p,), ctypes.c_size_t),
+    'secret_count_words': ((ctypes.c_char_p,), ctypes.c_size_t),
+
+    # Error handling
+    'secret_error_code': ((), ctypes.c_int32),
+    'secret_last_error': ((), ctypes.c_void_p),
+    'secret_clear_error': ((), None),
+
+    # Memory management
+    'secret_free': ((ctypes.c_void_p,), ctypes.c_int32),
+}
+
+for _name, (_argtypes, _restype) in _SIGNATURES.items():
+    # Fail at import, naming the symbol, if the library is out of date
+    try:
+        _fn = getattr(lib, _name)
+    except AttributeError:
+        raise ImportError(f"{lib_name} does not export {_name}; rebuild the library") from None
+    _fn.argtypes = list(_argtypes)
+    _fn.restype = _restype
 
-lib.secret_count_consonants.argtypes = [ctypes.c_char_p]
-lib.secret_count_consonants.restype = ctypes.c_size_t
-
-lib.secret_count_words.argtypes = [ctypes.c_char_p]
-lib.secret_count_words.restype = ctypes.c_size_t
-
-# Error handling
-lib.secret_error_code.argtypes = []
-lib.secret_error_code.restype = ctypes.c_int32
-
-lib.secret_last_error.argtypes = []
-lib.secret_last_error.restype = ctypes.c_void_p
-
-lib.secret_clear_error.argtypes = []
-lib.secret_clear_error.restype = None
+# ============================================================================
+# Resolved Functions
+# ============================================================================
 
-# Memory management
-lib.secret_free.argtypes = [ctypes.c_void_p]
-lib.secret_free.restype = ctypes.c_bool
+# Bind each symbol once so calls skip the attribute lookup on the CDLL object
+_secret_rot13_len = lib.secret_rot13_len
+_secret_reverse_len = lib.secret_reverse_len
+_secret_remove_vowels_len = lib.secret_remove_vowels_len
+_secret_uppercase_len = lib.secret_uppercase_len
+_secret_to_hex_len = lib.secret_to_hex_len
+_secret_from_hex_len = lib.secret_from_hex_len
+_secret_validate_length = lib.secret_validate_length
+_secret_is_ascii = lib.secret_is_ascii
+_secret_is_valid_hex = lib.secret_is_valid_hex
+_secret_count_chars = lib.secret_count_chars
+_secret_count_vowels = lib.secret_count_vowels
+_secret_count_vowels_batch = lib.secret_count_vowels_batch
+_secret_count_consonants = lib.secret_count_consonants
+_secret_count_words = lib.secret_count_words
+_secret_error_code = lib.secret_error_code
+_secret_last_error = lib.secret_last_error
+_secret_free = lib.secret_free
+
+_string_at = ctypes.string_at
 
 # ============================================================================
 # Helper Functions
 # ============================================================================
 
+def _take_string(ptr, length: int = -1) -> str:
+    """Copy a library-owned C string into a str and free it (length -1: NUL-terminated)"""
+    data = _string_at(ptr, length)
+    _secret_free(ptr)
+    return data.decode('utf-8')
+
 def _get_error():
     """Get the last error from the library"""
-    code = lib.secret_error_code()
+    code = _secret_error_code()
     if code == SECRET_ERROR_OK:
         return None
     
-    msg_ptr = lib.secret_last_error()
+    msg_ptr = _secret_last_error()
     if msg_ptr:
-        msg = ctypes.string_at(msg_ptr).decode('utf-8')
-        lib.secret_free(msg_ptr)
-        return SecretError(code, msg)
+        return SecretError(code, _take_string(msg_ptr))
     return SecretError(code, "Unknown error")
 
-def _call_string_fn(fn, *args):
-    """Call a function that returns a string, handling errors"""
-    # Convert string args to bytes
-    byte_args = [arg.encode('utf-8') if isinstance(arg, str) else arg for arg in args]
-    
-    result = fn(*byte_args)
-    if result is None or result == 0:
+def _as_utf8(text: Union[str, bytes]) -> bytes:
+    """Encode str arguments as UTF-8; bytes pass through unchanged"""
+    return text if isinstance(text, bytes) else text.encode('utf-8')
+
+def _call_bytes(fn, data: bytes):
+    """Call a string → string `_len` function on UTF-8 bytes, handling errors"""
+    length = ctypes.c_size_t()
+    # c_void_p restype: NULL comes back as None, so one truth test covers it
+    result = fn(data, ctypes.byref(length))
+    if not result:
         error = _get_error()
         if error:
             raise error
         return None
     
-    # Convert result to Python string
-    s = ctypes.string_at(result).decode('utf-8')
-    lib.secret_free(result)
-    return s
+    # Length is known, so no strlen scan
+    return _take_string(result, length.value)
 
 # ============================================================================
 # Public API
 # ============================================================================
 
-def rot13(text: str) -> str:
+def rot13(text: Union[str, bytes]) -> str:
     """Encode text using ROT13 cipher"""
-    return _call_string_fn(lib.secret_rot13, text)
+    return _call_bytes(_secret_rot13_len, _as_utf8(text))
 
-def reverse(text: str) -> str:
+def reverse(text: Union[str, bytes]) -> str:
     """Reverse the input string"""
-    return _call_string_fn(lib.secret_reverse, text)
+    return _call_bytes(_secret_reverse_len, _as_utf8(text))
 
-def remove_vowels(text: str) -> str:
+def remove_vowels(text: Union[str, bytes]) -> str:
     """Remove all vowels from text"""
-    return _call_string_fn(lib.secret_remove_vowels, text)
+    return _call_bytes(_secret_remove_vowels_len, _as_utf8(text))
 
-def uppercase(text: str) -> str:
+def uppercase(text: Union[str, bytes]) -> str:
     """Convert text to uppercase"""
-    return _call_string_fn(lib.secret_uppercase, text)
+    return _call_bytes(_secret_uppercase_len, _as_utf8(text))
 
-def to_hex(text: str) -> str:
+def to_hex(text: Union[str, bytes]) -> str:
     """Encode string to hex"""
-    return _call_string_fn(lib.secret_to_hex, text)
+    return _call_bytes(_secret_to_hex_len, _as_utf8(text))
 
-def from_hex(hex_str: str) -> str:
+def from_hex(hex_str: Union[str, bytes]) -> str:
     """Decode hex string to text (raises SecretError on invalid hex)"""
-    return _call_string_fn(lib.secret_from_hex, hex_str)
+    return _call_bytes(_secret_from_hex_len, _as_utf8(hex_str))
 
-def validate_length(text: str, min_len: int, max_len: int) -> bool:
+def validate_length(text: Union[str, bytes], min_len: int, max_len: int) -> bool:
     """Validate that text length is within bounds (raises SecretError if not)"""
-    result = lib.secret_validate_length(text.encode('utf-8'), min_len, max_len)
+    result = _secret_validate_length(_as_utf8(text), min_len, max_len)
     if not result:
         error = _get_error()
         if error:
             raise error
     return result
 
-def is_ascii(text: str) -> bool:
+def is_ascii(text: Union[str, bytes]) -> bool:
     """Check if text contains only ASCII characters"""
-    return lib.secret_is_ascii(text.encode('utf-8'))
+    return _secret_is_ascii(_as_utf8(text))
 
-def is_valid_hex(text: str) -> bool:
+def is_valid_hex(text: Union[str, bytes]) -> bool:
     """Check if text is valid hex"""
-    return lib.secret_is_valid_hex(text.encode('utf-8'))
+    return _secret_is_valid_hex(_as_utf8(text))
 
-def count_chars(text: str) -> int:
+def count_chars(text: Union[str, bytes]) -> int:
     """Count characters in string"""
-    return lib.secret_count_chars(text.encode('utf-8'))
+    return _secret_count_chars(_as_utf8(text))
 
-def count_vowels(text: str) -> int:
+def count_vowels(text: Union[str, bytes]) -> int:
     """Count vowels in string"""
-    return lib.secret_count_vowels(text.encode('utf-8'))
-
-def count_consonants(text: str) -> int:
+    return _secret_count_vowels(_as_utf8(text))
+
+def count_vowels_batch(texts) -> list:
+    """Count vowels in each of several strings with a single library call"""
+    encoded = [_as_utf8(text) for text in texts]
+    count = len(encoded)
+    ptrs = (ctypes.c_char_p * count)(*encoded)
+    lens = (ctypes.c_size_t * count)(*map(len, encoded))
+    out = (ctypes.c_size_t * count)()
+    if not _secret_count_vowels_batch(ptrs, lens, count, out):
+        raise _get_error() or SecretError(SECRET_ERROR_NULL_PARAMETER, "count_vowels_batch failed")
+    return list(out)
+
+def count_consonants(text: Union[str, bytes]) -> int:
     """Count consonants in string"""
-    return lib.secret_count_consonants(text.encode('utf-8'))
+    return _secret_count_consonants(_as_utf8(text))
 
-def count_words(text: str) -> int:
+def count_words(text: Union[str, bytes]) -> int:
     """Count words in string"""
-    return lib.secret_count_words(text.encode('utf-8'))
+    return _secret_count_words(_as_utf8(text))
@@ -12,6 +12,7 @@ def test_encoding():
     encoded = secret.rot13("Hello World")
     print(f"ROT13('Hello World') = '{encoded}'")
     assert encoded == "Uryyb Jbeyq"
+    assert secret.rot13(b"Hello World") == "Uryyb Jbeyq"  # bytes skip the encode
     
     # Reverse
     reversed_text = secret.reverse("Hello")
@@ -51,6 +52,20 @@ def test_hex():
         print(f"✓ Correctly raised error for invalid hex: {e}")
         assert e.code == secret.SECRET_ERROR_INVALID_HEX
     
+    # Round trip of a longer, non-ASCII message
+    message = "Hello, 世界! " * 64
+    assert secret.from_hex(secret.to_hex(message)) == message
+    assert secret.from_hex(secret.to_hex(message).upper()) == message
+    print("✓ Long round trip passed")
+    
+    # Non-ASCII input is rejected, not mis-sliced
+    try:
+        secret.from_hex("aéb")
+        assert False, "Should have raised error"
+    except secret.SecretError as e:
+        print(f"✓ Correctly raised error for non-ASCII hex: {e}")
+        assert e.code == secret.SECRET_ERROR_INVALID_HEX
+    
     print("✓ All hex tests passed\n")
 
 def test_validation():
@@ -101,6 +116,10 @@ def test_counting():
     print(f"count_vowels('{text}') = {vowels}")
     assert vowels == 3
     
+    batch = secret.count_vowels_batch([text, "", "AEIOU xyz", "héllo"])
+    print(f"count_vowels_batch([...]) = {batch}")
+    assert batch == [3, 0, 5, 1]
+    
     consonants = secret.count_consonants(text)
     print(f"count_consonants('{text}') = {consonants}")
     assert consonants == 7
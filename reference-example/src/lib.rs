@@ -31,7 +31,7 @@ use std::os::raw::c_char;
 use cimpl::{
     box_tracked, cimpl_free, cstr_or_return_null,
     deref_or_return_null, ok_or_return_false, ok_or_return_null, 
-    option_to_c_string, to_c_bytes, to_c_string, 
+    option_to_c_string, to_c_bytes, to_c_string, to_c_string_with_len,
     CimplError,
 };
 
@@ -135,25 +135,123 @@ fn substitute(input: &str, from: char, to: char) -> String {
     input.replace(from, &to.to_string())
 }
 
+/// Lowercase hex digits, indexed by nibble value
+const HEX_DIGITS: &[u8; 16] = b"0123456789abcdef";
+
+/// Marks a byte that is not a hex digit in `HEX_VALUES`
+const NOT_HEX: u8 = 0xff;
+
+/// Nibble value of every byte, or `NOT_HEX`
+const HEX_VALUES: [u8; 256] = {
+    let mut table = [NOT_HEX; 256];
+    let mut i = 0;
+    while i < 10 {
+        table[b'0' as usize + i] = i as u8;
+        i += 1;
+    }
+    let mut i = 0;
+    while i < 6 {
+        table[b'a' as usize + i] = 10 + i as u8;
+        table[b'A' as usize + i] = 10 + i as u8;
+        i += 1;
+    }
+    table
+};
+
+/// Is this byte an ASCII hex digit? (branch-free range checks)
+#[inline]
+fn is_hex_digit(b: u8) -> bool {
+    (b.wrapping_sub(b'0') < 10) | ((b | 0x20).wrapping_sub(b'a') < 6)
+}
+
 /// Encode string to hex
 fn to_hex(input: &str) -> String {
-    input.bytes().map(|b| format!("{:02x}", b)).collect()
+    let mut hex = String::with_capacity(input.len() * 2);
+    for &b in input.as_bytes() {
+        hex.push(HEX_DIGITS[(b >> 4) as usize] as char);
+        hex.push(HEX_DIGITS[(b & 0x0f) as usize] as char);
+    }
+    hex
+}
+
+/// Broadcast a byte into every lane of a u64
+const fn lanes(b: u8) -> u64 {
+    0x0101_0101_0101_0101 * b as u64
+}
+
+/// The high bit of every byte lane
+const HIGH_BITS: u64 = lanes(0x80);
+
+/// Sets the high bit of each lane whose byte is in `lo..=hi`
+///
+/// Every byte of `v` must be below 0x80, so no addition carries between lanes.
+#[inline]
+fn swar_in_range(v: u64, lo: u8, hi: u8) -> u64 {
+    let at_least_lo = v.wrapping_add(lanes(0x80 - lo));
+    let above_hi = v.wrapping_add(lanes(0x7f - hi));
+    at_least_lo & !above_hi & HIGH_BITS
+}
+
+/// Decode 8 hex digits into 4 bytes, all lanes at once (SWAR)
+///
+/// Returns None if any of the 8 bytes is not a hex digit.
+#[inline]
+fn decode_hex8(chunk: [u8; 8]) -> Option<[u8; 4]> {
+    let v = u64::from_le_bytes(chunk);
+    if v & HIGH_BITS != 0 {
+        return None;
+    }
+    let digit = swar_in_range(v, b'0', b'9');
+    let letter = swar_in_range(v | lanes(0x20), b'a', b'f');
+    if digit | letter != HIGH_BITS {
+        return None;
+    }
+
+    // '0'..='9' carry their value in the low nibble, letters need 9 added
+    let nibbles = (v & lanes(0x0f)) + (letter >> 7) * 9;
+    // Low byte of each 16-bit lane becomes (first nibble << 4) | second nibble
+    let pairs = ((nibbles << 4) | (nibbles >> 8)) & 0x00ff_00ff_00ff_00ff;
+    // Squeeze the four result bytes together
+    let packed = (pairs | (pairs >> 8)) & 0x0000_ffff_0000_ffff;
+    Some(((packed | (packed >> 16)) as u32).to_le_bytes())
+}
+
+/// Decode hex digit pairs one byte at a time, appending to `out`
+fn decode_hex_pairs(hex: &[u8], out: &mut Vec<u8>) -> Result<(), ProcessError> {
+    for pair in hex.chunks_exact(2) {
+        let hi = HEX_VALUES[pair[0] as usize];
+        let lo = HEX_VALUES[pair[1] as usize];
+        // NOT_HEX has its high nibble set, valid nibbles never do
+        if (hi | lo) & 0xf0 != 0 {
+            return Err(ProcessError::InvalidHex(String::from_utf8_lossy(pair).into_owned()));
+        }
+        out.push(hi << 4 | lo);
+    }
+    Ok(())
 }
 
 /// Decode hex to string
 fn from_hex(hex: &str) -> Result<String, ProcessError> {
+    // Work on bytes: slicing the &str by byte offset would panic on non-ASCII input
+    let hex = hex.as_bytes();
+
     // Must be even length
     if hex.len() % 2 != 0 {
         return Err(ProcessError::InvalidHex("odd length".to_string()));
     }
     
-    let mut bytes = Vec::new();
-    for i in (0..hex.len()).step_by(2) {
-        let byte_str = &hex[i..i + 2];
-        let byte = u8::from_str_radix(byte_str, 16)
-            .map_err(|_| ProcessError::InvalidHex(byte_str.to_string()))?;
-        bytes.push(byte);
+    let mut bytes = Vec::with_capacity(hex.len() / 2);
+    let mut chunks = hex.chunks_exact(8);
+    for chunk in &mut chunks {
+        match decode_hex8([
+            chunk[0], chunk[1], chunk[2], chunk[3], chunk[4], chunk[5], chunk[6], chunk[7],
+        ]) {
+            Some(decoded) => bytes.extend_from_slice(&decoded),
+            // Rerun the chunk pair by pair to report the offending digits
+            None => decode_hex_pairs(chunk, &mut bytes)?,
+        }
     }
+    decode_hex_pairs(chunks.remainder(), &mut bytes)?;
     
     String::from_utf8(bytes)
         .map_err(|_| ProcessError::InvalidFormat("invalid UTF-8".to_string()))
@@ -171,20 +269,35 @@ fn validate_length(input: &str, min: usize, max: usize) -> Result<(), ProcessErr
     }
 }
 
+/// Is this byte an ASCII vowel (either case)?
+///
+/// Only ASCII letters can match, so scanning UTF-8 bytes gives the same
+/// answer as scanning chars: multi-byte sequences are all >= 0x80.
+#[inline]
+fn is_vowel(b: u8) -> bool {
+    // OR-ing in 0x20 lowercases ASCII letters and maps nothing else onto a vowel
+    matches!(b | 0x20, b'a' | b'e' | b'i' | b'o' | b'u')
+}
+
+/// Is this byte an ASCII letter (either case)?
+#[inline]
+fn is_ascii_letter(b: u8) -> bool {
+    (b | 0x20).wrapping_sub(b'a') < 26
+}
+
 /// Count vowels in text
-fn count_vowels(input: &str) -> usize {
-    input
-        .chars()
-        .filter(|c| matches!(c.to_ascii_lowercase(), 'a' | 'e' | 'i' | 'o' | 'u'))
-        .count()
+///
+/// Branch-free per byte, so the compiler vectorizes the loop.
+fn count_vowels(input: &[u8]) -> usize {
+    input.iter().map(|&b| is_vowel(b) as usize).sum()
 }
 
 /// Count consonants in text
-fn count_consonants(input: &str) -> usize {
+fn count_consonants(input: &[u8]) -> usize {
     input
-        .chars()
-        .filter(|c| c.is_ascii_alphabetic() && !matches!(c.to_ascii_lowercase(), 'a' | 'e' | 'i' | 'o' | 'u'))
-        .count()
+        .iter()
+        .map(|&b| (is_ascii_letter(b) && !is_vowel(b)) as usize)
+        .sum()
 }
 
 /// Count words (split by whitespace)
@@ -261,6 +374,64 @@ pub extern "C" fn secret_from_hex(hex: *const c_char) -> *mut c_char {
     to_c_string(decoded)
 }
 
+// ============================================================================
+// FFI Functions: String In → String Out (with length)
+// ============================================================================
+//
+// Each of these matches the function without the `_len` suffix, but also
+// writes the byte length of the result (excluding the NUL terminator) to
+// `out_len`, so callers can copy it without scanning for the terminator.
+// `out_len` may be NULL.
+
+/// Encodes text using ROT13 cipher, reporting the result length
+/// Tests: cstr_or_return_null!, length out parameter
+#[no_mangle]
+pub extern "C" fn secret_rot13_len(input: *const c_char, out_len: *mut usize) -> *mut c_char {
+    let text = cstr_or_return_null!(input);
+    to_c_string_with_len(rot13(&text), out_len)
+}
+
+/// Reverses the input string, reporting the result length
+/// Tests: cstr_or_return_null!, length out parameter
+#[no_mangle]
+pub extern "C" fn secret_reverse_len(input: *const c_char, out_len: *mut usize) -> *mut c_char {
+    let text = cstr_or_return_null!(input);
+    to_c_string_with_len(text.chars().rev().collect::<String>(), out_len)
+}
+
+/// Removes all vowels from text, reporting the result length
+/// Tests: cstr_or_return_null!, length out parameter
+#[no_mangle]
+pub extern "C" fn secret_remove_vowels_len(input: *const c_char, out_len: *mut usize) -> *mut c_char {
+    let text = cstr_or_return_null!(input);
+    to_c_string_with_len(remove_vowels(&text), out_len)
+}
+
+/// Converts text to uppercase, reporting the result length
+/// Tests: cstr_or_return_null!, length out parameter
+#[no_mangle]
+pub extern "C" fn secret_uppercase_len(input: *const c_char, out_len: *mut usize) -> *mut c_char {
+    let text = cstr_or_return_null!(input);
+    to_c_string_with_len(text.to_uppercase(), out_len)
+}
+
+/// Encodes string to hex, reporting the result length
+/// Tests: cstr_or_return_null!, length out parameter
+#[no_mangle]
+pub extern "C" fn secret_to_hex_len(input: *const c_char, out_len: *mut usize) -> *mut c_char {
+    let text = cstr_or_return_null!(input);
+    to_c_string_with_len(to_hex(&text), out_len)
+}
+
+/// Decodes hex string to text, reporting the result length (can fail!)
+/// Tests: ok_or_return_null! with automatic From conversion, length out parameter
+#[no_mangle]
+pub extern "C" fn secret_from_hex_len(hex: *const c_char, out_len: *mut usize) -> *mut c_char {
+    let hex_str = cstr_or_return_null!(hex);
+    let decoded = ok_or_return_null!(from_hex(&hex_str));
+    to_c_string_with_len(decoded, out_len)
+}
+
 // ============================================================================
 // FFI Functions: Validation (Option → bool)
 // ============================================================================
@@ -294,7 +465,8 @@ pub extern "C" fn secret_is_ascii(input: *const c_char) -> bool {
 pub extern "C" fn secret_is_valid_hex(input: *const c_char) -> bool {
     use cimpl::cstr_or_return;
     let text = cstr_or_return!(input, false);
-    text.len() % 2 == 0 && text.chars().all(|c| c.is_ascii_hexdigit())
+    // Fold rather than short-circuit so the scan vectorizes
+    text.len() % 2 == 0 && text.bytes().fold(true, |ok, b| ok & is_hex_digit(b))
 }
 
 // ============================================================================
@@ -316,7 +488,41 @@ pub extern "C" fn secret_count_chars(input: *const c_char) -> usize {
 pub extern "C" fn secret_count_vowels(input: *const c_char) -> usize {
     use cimpl::cstr_or_return;
     let text = cstr_or_return!(input, 0);
-    count_vowels(&text)
+    count_vowels(text.as_bytes())
+}
+
+/// Counts vowels in each of `count` byte strings with a single call
+///
+/// `texts[i]` points to `lens[i]` bytes (no NUL terminator needed) and its
+/// vowel count is written to `out[i]`. Batching amortizes the per-call FFI
+/// overhead when counting many short strings.
+/// Returns false (with the error set) if any array pointer is NULL.
+/// Tests: ptr_or_return! with false, array parameters
+#[no_mangle]
+pub extern "C" fn secret_count_vowels_batch(
+    texts: *const *const u8,
+    lens: *const usize,
+    count: usize,
+    out: *mut usize,
+) -> bool {
+    use cimpl::ptr_or_return;
+    ptr_or_return!(texts, false);
+    ptr_or_return!(lens, false);
+    ptr_or_return!(out, false);
+
+    let texts = unsafe { std::slice::from_raw_parts(texts, count) };
+    let lens = unsafe { std::slice::from_raw_parts(lens, count) };
+    let out = unsafe { std::slice::from_raw_parts_mut(out, count) };
+
+    for ((&text, &len), slot) in texts.iter().zip(lens).zip(out.iter_mut()) {
+        *slot = if len == 0 {
+            0
+        } else {
+            ptr_or_return!(text, false);
+            count_vowels(unsafe { std::slice::from_raw_parts(text, len) })
+        };
+    }
+    true
 }
 
 /// Counts consonants in string
@@ -325,7 +531,7 @@ pub extern "C" fn secret_count_vowels(input: *const c_char) -> usize {
 pub extern "C" fn secret_count_consonants(input: *const c_char) -> usize {
     use cimpl::cstr_or_return;
     let text = cstr_or_return!(input, 0);
-    count_consonants(&text)
+    count_consonants(text.as_bytes())
 }
 
 /// Counts words in string
@@ -449,8 +655,8 @@ pub extern "C" fn message_get_stats(msg: *mut SecretMessage) -> *mut MessageStat
     let stats = MessageStats {
         length: message.content.len(),
         word_count: count_words(&message.content),
-        vowel_count: count_vowels(&message.content),
-        consonant_count: count_consonants(&message.content),
+        vowel_count: count_vowels(message.content.as_bytes()),
+        consonant_count: count_consonants(message.content.as_bytes()),
     };
     
     box_tracked!(stats)
@@ -473,6 +679,13 @@ pub extern "C" fn secret_last_error() -> *mut c_char {
     option_to_c_string!(CimplError::last_message())
 }
 
+/// Clears the last error
+/// Tests: error state reset
+#[no_mangle]
+pub extern "C" fn secret_clear_error() {
+    CimplError::take_last();
+}
+
 // ============================================================================
 // FFI Functions: Memory Management
 // ============================================================================
@@ -51,8 +51,8 @@ pub mod macros;
 // Re-export main types and functions for convenience
 pub use cimpl_error::{CimplError, Result};
 pub use utils::{
-    cimpl_free, safe_slice_from_raw_parts, to_c_bytes, to_c_string, track_arc, track_arc_mutex,
-    track_box,
+    cimpl_free, safe_slice_from_raw_parts, to_c_bytes, to_c_string, to_c_string_with_len,
+    track_arc, track_arc_mutex, track_box,
 };
 
 // Re-export internal utilities (for macro use only - not part of public API)
@@ -290,6 +290,31 @@ pub fn to_c_string(s: String) -> *mut std::os::raw::c_char {
     }
 }
 
+/// Converts a Rust String to a C string, also reporting its length
+///
+/// Same as [`to_c_string`], but writes the byte length of the string
+/// (excluding the NUL terminator) to `out_len`, so callers can copy the
+/// result without scanning for the terminator.
+///
+/// # Arguments
+/// * `s` - The Rust String to convert
+/// * `out_len` - Receives the length; may be null, and is left untouched if
+///   the conversion fails
+///
+/// # Returns
+/// * `*mut c_char` - Pointer to the C string, or null on error
+///
+/// # Safety
+/// The returned pointer must be freed exactly once by C code
+pub fn to_c_string_with_len(s: String, out_len: *mut usize) -> *mut std::os::raw::c_char {
+    let len = s.len();
+    let ptr = to_c_string(s);
+    if !ptr.is_null() && !out_len.is_null() {
+        unsafe { *out_len = len };
+    }
+    ptr
+}
+
 /// Converts a `Vec <u8>` to a tracked C byte array pointer
 ///
 /// The returned pointer is tracked for allocation safety and MUST be freed
@@ -356,6 +381,26 @@ mod tests {
         cimpl_free(c_string as *mut std::ffi::c_void);
     }
 
+    #[test]
+    fn test_to_c_string_with_len() {
+        let mut len = 0usize;
+        let c_string = to_c_string_with_len("Hello, C!".to_string(), &mut len);
+        assert!(!c_string.is_null());
+        assert_eq!(len, 9);
+        cimpl_free(c_string as *mut std::ffi::c_void);
+
+        // Null out_len is allowed
+        let c_string = to_c_string_with_len("abc".to_string(), std::ptr::null_mut());
+        assert!(!c_string.is_null());
+        cimpl_free(c_string as *mut std::ffi::c_void);
+
+        // Failed conversion leaves out_len untouched
+        let mut len = 42usize;
+        let c_string = to_c_string_with_len("a\0b".to_string(), &mut len);
+        assert!(c_string.is_null());
+        assert_eq!(len, 42);
+    }
+
     #[test]
     fn test_to_c_bytes_basic() {
         // Test basic byte array conversion
@@ -6,46 +6,81 @@ allowing Python file-like objects to be used as streams in Rust/C code.
 """
 
 import ctypes
+import io
 import os
 import sys
+import weakref
 from typing import BinaryIO, Optional
 from ctypes import c_void_p, c_int32, c_int64, c_uint8, c_size_t, POINTER, CFUNCTYPE
 
 
+# Library file name for this platform
+if sys.platform == 'darwin':
+    _LIB_NAME = 'libcimpl_stream.dylib'
+elif sys.platform == 'win32':
+    _LIB_NAME = 'cimpl_stream.dll'
+else:
+    _LIB_NAME = 'libcimpl_stream.so'
+
+_TARGET_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'target')
+)
+
+# Where to look, in order of preference: release build, then debug build
+_CANDIDATES = tuple(
+    os.path.join(_TARGET_DIR, profile, _LIB_NAME) for profile in ('release', 'debug')
+)
+
+
 # Find the library
 def _find_library():
-    """Locate the cimpl_stream library."""
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    lib_dir = os.path.join(script_dir, '..', '..', 'target', 'release')
-    
-    if sys.platform == 'darwin':
-        lib_name = 'libcimpl_stream.dylib'
-    elif sys.platform == 'win32':
-        lib_name = 'cimpl_stream.dll'
-    else:
-        lib_name = 'libcimpl_stream.so'
+    """
+    Locate the cimpl_stream library.
     
-    lib_path = os.path.join(lib_dir, lib_name)
+    A path in the CIMPL_STREAM_LIB environment variable takes precedence;
+    otherwise the release and debug build directories are probed. The variable
+    is only ever read here, so it always reflects the user's choice.
+    """
+    override = os.environ.get('CIMPL_STREAM_LIB')
+    if override and os.path.isfile(override):
+        return override
     
-    if not os.path.exists(lib_path):
+    lib_path = next((path for path in _CANDIDATES if os.path.isfile(path)), None)
+    if lib_path is None:
         raise FileNotFoundError(
-            f"cimpl_stream library not found at {lib_path}. "
+            f"cimpl_stream library not found at {' or '.join(_CANDIDATES)}. "
             f"Build it with: cargo build --release"
         )
     
     return lib_path
 
 
-# Load library
-_lib = ctypes.CDLL(_find_library())
+# Resolved once; importlib.reload() re-runs this module in the same namespace
+# and reuses it
+_LIB_PATH = globals().get('_LIB_PATH') or _find_library()
+
+# Load library. Default RTLD_LOCAL: other cimpl-based libraries export their
+# own cimpl_free, and a global load would let calls resolve to the wrong copy
+_lib = ctypes.CDLL(_LIB_PATH)
+
+# Fail at import, naming the symbol, if the library is out of date
+_REQUIRED_SYMBOLS = (
+    'cimpl_stream_new', 'cimpl_stream_read', 'cimpl_stream_write',
+    'cimpl_stream_seek', 'cimpl_stream_flush', 'cimpl_stream_last_error',
+    'cimpl_stream_error_code', 'cimpl_stream_clear_error', 'cimpl_stream_take_error',
+    'cimpl_free',
+)
+for _name in _REQUIRED_SYMBOLS:
+    if not hasattr(_lib, _name):
+        raise ImportError(f"cimpl_stream library does not export {_name}; rebuild it")
+
+# cimpl_stream_new_fd is only built on Unix
+_HAS_FD_STREAMS = hasattr(_lib, 'cimpl_stream_new_fd')
 
 # Type aliases
 intptr_t = ctypes.c_ssize_t
 
 # Opaque types
-class CimplStreamContext(ctypes.Structure):
-    pass
-
 class CimplStream(ctypes.Structure):
     pass
 
@@ -56,6 +91,10 @@ class SeekMode:
     CURRENT = 1     # CIMPL_SEEK_MODE_CURRENT
     END = 2         # CIMPL_SEEK_MODE_END
 
+# os.SEEK_* -> SeekMode, and back, indexed by value
+_WHENCE_MAP = (SeekMode.START, SeekMode.CURRENT, SeekMode.END)
+_MODE_TO_WHENCE = (os.SEEK_SET, os.SEEK_CUR, os.SEEK_END)
+
 class ErrorCode:
     """Error codes for stream operations."""
     OK = 0                      # CIMPL_STREAM_ERROR_OK
@@ -67,15 +106,17 @@ class ErrorCode:
     IO_OPERATION = 100          # CIMPL_STREAM_ERROR_IO_OPERATION
     INVALID_BUFFER = 101        # CIMPL_STREAM_ERROR_INVALID_BUFFER
 
-# Callback type definitions
-ReadCallback = CFUNCTYPE(intptr_t, POINTER(CimplStreamContext), POINTER(c_uint8), c_size_t)
-SeekCallback = CFUNCTYPE(c_int64, POINTER(CimplStreamContext), c_int64, c_int32)
-WriteCallback = CFUNCTYPE(intptr_t, POINTER(CimplStreamContext), POINTER(c_uint8), c_size_t)
-FlushCallback = CFUNCTYPE(c_int32, POINTER(CimplStreamContext))
+# Callback type definitions. The context and data pointers are declared
+# c_void_p, which is the same C ABI but delivers them to Python as plain ints:
+# the context is a registry key and the data pointer goes to from_address.
+ReadCallback = CFUNCTYPE(intptr_t, c_void_p, c_void_p, c_size_t)
+SeekCallback = CFUNCTYPE(c_int64, c_void_p, c_int64, c_int32)
+WriteCallback = CFUNCTYPE(intptr_t, c_void_p, c_void_p, c_size_t)
+FlushCallback = CFUNCTYPE(c_int32, c_void_p)
 
 # Function signatures
 _lib.cimpl_stream_new.argtypes = [
-    POINTER(CimplStreamContext),
+    c_void_p,
     ReadCallback,
     SeekCallback,
     WriteCallback,
@@ -83,10 +124,15 @@ _lib.cimpl_stream_new.argtypes = [
 ]
 _lib.cimpl_stream_new.restype = POINTER(CimplStream)
 
+if _HAS_FD_STREAMS:
+    _lib.cimpl_stream_new_fd.argtypes = [ctypes.c_int]
+    _lib.cimpl_stream_new_fd.restype = POINTER(CimplStream)
+
 _lib.cimpl_stream_read.argtypes = [POINTER(CimplStream), POINTER(c_uint8), c_size_t]
 _lib.cimpl_stream_read.restype = intptr_t
 
-_lib.cimpl_stream_write.argtypes = [POINTER(CimplStream), POINTER(c_uint8), c_size_t]
+# c_void_p so bytes can be passed as-is; cimpl_stream_write only reads the buffer
+_lib.cimpl_stream_write.argtypes = [POINTER(CimplStream), c_void_p, c_size_t]
 _lib.cimpl_stream_write.restype = intptr_t
 
 _lib.cimpl_stream_seek.argtypes = [POINTER(CimplStream), c_int64, c_int32]
@@ -96,7 +142,9 @@ _lib.cimpl_stream_flush.argtypes = [POINTER(CimplStream)]
 _lib.cimpl_stream_flush.restype = c_int32
 
 _lib.cimpl_stream_last_error.argtypes = []
-_lib.cimpl_stream_last_error.restype = ctypes.c_char_p
+# c_void_p, not c_char_p: c_char_p would hand back a bytes copy and lose the
+# pointer that has to go back to cimpl_free
+_lib.cimpl_stream_last_error.restype = c_void_p
 
 _lib.cimpl_stream_error_code.argtypes = []
 _lib.cimpl_stream_error_code.restype = c_int32
@@ -104,6 +152,9 @@ _lib.cimpl_stream_error_code.restype = c_int32
 _lib.cimpl_stream_clear_error.argtypes = []
 _lib.cimpl_stream_clear_error.restype = None
 
+_lib.cimpl_stream_take_error.argtypes = [ctypes.c_char_p, c_size_t, POINTER(c_int32)]
+_lib.cimpl_stream_take_error.restype = c_size_t
+
 _lib.cimpl_free.argtypes = [c_void_p]
 _lib.cimpl_free.restype = c_int32
 
@@ -136,31 +187,162 @@ class InvalidBufferError(CimplStreamError):
     pass
 
 
-def _check_error(result, func_name: str):
-    """Check for errors and raise appropriate exceptions."""
-    if result < 0 or result is None:
-        code = _lib.cimpl_stream_error_code()
-        error_ptr = _lib.cimpl_stream_last_error()
+_ERROR_BUFFER_SIZE = 1024
+
+
+def _raise_error(func_name: str):
+    """
+    Raise the exception for the last cimpl_stream error.
+    
+    Only called once a call has already reported failure, so the success
+    path in each method is a single integer comparison.
+    """
+    # Code and message in one call; longer messages come back truncated
+    buf = ctypes.create_string_buffer(_ERROR_BUFFER_SIZE)
+    code = c_int32()
+    length = _lib.cimpl_stream_take_error(buf, _ERROR_BUFFER_SIZE, ctypes.byref(code))
+    code = code.value
+    
+    if length:
+        message = buf.value.decode('utf-8', errors='replace')
+    else:
+        message = f"{func_name} failed"
+    
+    # Map error codes to specific exception types
+    if code == ErrorCode.NULL_PARAMETER:
+        raise NullParameterError(message, code)
+    elif code == ErrorCode.INVALID_HANDLE:
+        raise InvalidHandleError(message, code)
+    elif code == ErrorCode.IO_OPERATION:
+        raise IoError(message, code)
+    elif code == ErrorCode.INVALID_BUFFER:
+        raise InvalidBufferError(message, code)
+    else:
+        raise CimplStreamError(message, code)
+
+
+def _c_buffer(data, length: int) -> memoryview:
+    """
+    View length bytes at a callback's data pointer without copying.
+    
+    The view is only valid until the callback returns.
+    """
+    return memoryview((c_uint8 * length).from_address(data)).cast('B')
+
+
+# File types whose write() has copied its argument by the time it returns, so
+# they can be handed a view over memory that is about to be reused
+_COPYING_WRITERS = (io.BytesIO, io.BufferedWriter, io.BufferedRandom, io.FileIO)
+
+
+def _write_all(file_obj, data) -> None:
+    """
+    Write all of data to file_obj, repeating after short writes.
+    
+    data may be reused or freed once this returns, so only _COPYING_WRITERS get
+    a view of it; any other file object gets its own bytes copy, which it is
+    free to keep. A write() that returns None is taken to have written
+    everything, as the write callback has always assumed.
+    """
+    zero_copy = type(file_obj) in _COPYING_WRITERS
+    pending = memoryview(data) if zero_copy else bytes(data)
+    try:
+        while pending:
+            written = file_obj.write(pending)
+            if written is None:
+                break
+            if written <= 0:
+                raise OSError(f"write() made no progress with {len(pending)} bytes left")
+            pending = pending[written:]
+    finally:
+        if zero_copy:
+            pending.release()
+
+
+# Live streams, keyed by the context value passed to cimpl_stream_new (the
+# Stream's id). One set of callbacks serves every Stream; the entries are weak
+# so the registry never keeps a Stream alive.
+_STREAM_REGISTRY = {}
+
+
+def _release_stream(key, free, handle):
+    """
+    Free a stream handle.
+    
+    Run by the weakref.finalize registered in Stream.__init__, either from
+    close() or when the Stream is collected. It gets the pieces it needs as
+    arguments; holding the Stream itself would keep it alive forever.
+    """
+    _STREAM_REGISTRY.pop(key, None)
+    free(handle)
+
+
+@ReadCallback
+def _read_cb(ctx, data, length):
+    try:
+        stream = _STREAM_REGISTRY[ctx]()
         
-        if error_ptr:
-            message = error_ptr.decode('utf-8')
-            _lib.cimpl_free(error_ptr)
-        else:
-            message = f"{func_name} failed"
+        readinto = stream._file_readinto
+        if readinto is not None:
+            if not length:
+                return 0
+            return readinto(_c_buffer(data, length))
         
-        # Map error codes to specific exception types
-        if code == ErrorCode.NULL_PARAMETER:
-            raise NullParameterError(message, code)
-        elif code == ErrorCode.INVALID_HANDLE:
-            raise InvalidHandleError(message, code)
-        elif code == ErrorCode.IO_OPERATION:
-            raise IoError(message, code)
-        elif code == ErrorCode.INVALID_BUFFER:
-            raise InvalidBufferError(message, code)
-        else:
-            raise CimplStreamError(message, code)
-    
-    return result
+        bytes_data = stream._file.read(length)
+        if not bytes_data:
+            return 0
+        bytes_read = len(bytes_data)
+        ctypes.memmove(data, bytes_data, bytes_read)
+        return bytes_read
+    except Exception as e:
+        print(f"Read callback error: {e}", file=sys.stderr)
+        return -1
+
+
+@SeekCallback
+def _seek_cb(ctx, offset, mode):
+    try:
+        stream = _STREAM_REGISTRY[ctx]()
+        if not 0 <= mode < len(_MODE_TO_WHENCE):
+            return -1
+        
+        return stream._file.seek(offset, _MODE_TO_WHENCE[mode])
+    except Exception as e:
+        print(f"Seek callback error: {e}", file=sys.stderr)
+        return -1
+
+
+@WriteCallback
+def _write_cb(ctx, data, length):
+    try:
+        if not length:
+            return 0
+        stream = _STREAM_REGISTRY[ctx]()
+        
+        # View the C buffer in place; it is only valid until we return, so
+        # it is released afterwards and anything still holding it fails
+        # instead of reading freed memory. _write_all only shares the view
+        # with file types that copy it.
+        view = _c_buffer(data, length)
+        try:
+            _write_all(stream._file, view)
+            return length
+        finally:
+            view.release()
+    except Exception as e:
+        print(f"Write callback error: {e}", file=sys.stderr)
+        return -1
+
+
+@FlushCallback
+def _flush_cb(ctx):
+    try:
+        stream = _STREAM_REGISTRY[ctx]()
+        stream._file.flush()
+        return 0
+    except Exception as e:
+        print(f"Flush callback error: {e}", file=sys.stderr)
+        return -1
 
 
 class Stream:
@@ -178,6 +360,19 @@ class Stream:
             stream.write(b"Hello!")
     """
     
+    # Chunk size for read(-1); larger chunks mean fewer trips through the
+    # read callback per megabyte. Also the largest read buffer a Stream keeps.
+    DEFAULT_BUFFER_SIZE = 128 * 1024
+    
+    # Bound once here so the per-call methods skip the lookup on the CDLL
+    # object. ctypes function pointers are not descriptors, so self._c_read
+    # is the plain function.
+    _c_read = _lib.cimpl_stream_read
+    _c_write = _lib.cimpl_stream_write
+    _c_seek = _lib.cimpl_stream_seek
+    _c_flush = _lib.cimpl_stream_flush
+    _c_free = _lib.cimpl_free
+    
     def __init__(self, file_obj: BinaryIO):
         """
         Create a stream from a Python file-like object.
@@ -185,75 +380,67 @@ class Stream:
         Args:
             file_obj: A file-like object with read, write, seek, and flush methods.
         """
-        self._file = file_obj
-        self._handle: Optional[POINTER(CimplStream)] = None
+        # An unbuffered FileIO is just an fd: let the C side read and write it
+        # directly, with no Python callbacks. Buffered files keep the callback
+        # path so their buffer and position stay authoritative.
+        if _HAS_FD_STREAMS and type(file_obj) is io.FileIO:
+            self._open(file_obj, file_obj.fileno())
+        else:
+            self._open(file_obj, None)
+    
+    @classmethod
+    def from_fd(cls, fd: int) -> 'Stream':
+        """
+        Create a stream that reads and writes a file descriptor directly.
         
-        # Create callback functions that capture self
-        @ReadCallback
-        def read_cb(ctx, data, length):
-            try:
-                bytes_data = self._file.read(length)
-                if not bytes_data:
-                    return 0
-                bytes_read = len(bytes_data)
-                ctypes.memmove(data, bytes_data, bytes_read)
-                return bytes_read
-            except Exception as e:
-                print(f"Read callback error: {e}", file=sys.stderr)
-                return -1
+        The descriptor is borrowed: closing the stream does not close it, and
+        it must stay open for as long as the stream is in use. Unix only.
         
-        @SeekCallback
-        def seek_cb(ctx, offset, mode):
-            try:
-                if mode == SeekMode.START:
-                    whence = os.SEEK_SET
-                elif mode == SeekMode.CURRENT:
-                    whence = os.SEEK_CUR
-                elif mode == SeekMode.END:
-                    whence = os.SEEK_END
-                else:
-                    return -1
-                
-                new_pos = self._file.seek(offset, whence)
-                return new_pos
-            except Exception as e:
-                print(f"Seek callback error: {e}", file=sys.stderr)
-                return -1
+        Args:
+            fd: An open file descriptor.
+        """
+        if not _HAS_FD_STREAMS:
+            raise io.UnsupportedOperation(
+                "file descriptor streams are not supported on this platform"
+            )
         
-        @WriteCallback
-        def write_cb(ctx, data, length):
-            try:
-                bytes_data = ctypes.string_at(data, length)
-                bytes_written = self._file.write(bytes_data)
-                return bytes_written if bytes_written is not None else length
-            except Exception as e:
-                print(f"Write callback error: {e}", file=sys.stderr)
-                return -1
+        stream = cls.__new__(cls)
+        stream._open(None, fd)
+        return stream
+    
+    def _open(self, file_obj, fd: Optional[int]) -> None:
+        """Create the native stream, over fd if given, else over file_obj's methods."""
+        self._file = file_obj
+        self._handle: Optional[POINTER(CimplStream)] = None
         
-        @FlushCallback
-        def flush_cb(ctx):
-            try:
-                self._file.flush()
-                return 0
-            except Exception as e:
-                print(f"Flush callback error: {e}", file=sys.stderr)
-                return -1
+        # Reused by read(); replaced with a larger one when a read needs it,
+        # up to DEFAULT_BUFFER_SIZE
+        self._set_read_buf(64 * 1024)
         
-        # Keep references to prevent garbage collection
-        self._callbacks = (read_cb, seek_cb, write_cb, flush_cb)
+        # BytesIO can fill the C buffer in place, a memcpy out of its own
+        # buffer. Other file-likes keep the generic path, since their readinto
+        # may not exist or may just wrap read().
+        if type(file_obj) is io.BytesIO:
+            self._file_readinto = file_obj.readinto
+        else:
+            self._file_readinto = None
         
-        # Create the stream (use id(self) as context pointer)
-        context = ctypes.cast(id(self), POINTER(CimplStreamContext))
-        self._handle = _lib.cimpl_stream_new(
-            context,
-            read_cb,
-            seek_cb,
-            write_cb,
-            flush_cb
-        )
+        key = id(self)
+        if fd is not None:
+            self._handle = _lib.cimpl_stream_new_fd(fd)
+            if not self._handle:
+                _raise_error("cimpl_stream_new_fd")
+        else:
+            # The shared module-level callbacks find this Stream through the
+            # registry, using id(self) as the context pointer
+            _STREAM_REGISTRY[key] = weakref.ref(self)
+            self._handle = _lib.cimpl_stream_new(key, _read_cb, _seek_cb, _write_cb, _flush_cb)
+            if not self._handle:
+                del _STREAM_REGISTRY[key]
+                _raise_error("cimpl_stream_new")
         
-        if not self._handle:
-            _check_error(None, "cimpl_stream_new")
+        # Frees the handle when the Stream is collected, without a __del__
+        self._finalizer = weakref.finalize(self, _release_stream, key, self._c_free, self._handle)
     
     def read(self, size: int = -1) -> bytes:
         """
@@ -265,24 +452,88 @@ class Stream:
         Returns:
             Bytes read from the stream.
         """
+        if size < 0:
+            return self._read_all()
+        
+        if not self._handle:
+            raise CimplStreamError("Stream is closed", 0)
+        if size == 0:
+            return b""
+        if size > len(self._read_buf):
+            if size > self.DEFAULT_BUFFER_SIZE:
+                # Too large to keep for the life of the stream; read through
+                # a buffer that is dropped once this read returns
+                buf = bytearray(size)
+                del buf[self.readinto(buf):]
+                return bytes(buf)
+            self._set_read_buf(size)
+        
+        bytes_read = self._c_read(self._handle, self._read_cbuf, size)
+        if bytes_read < 0:
+            _raise_error("cimpl_stream_read")
+        return self._read_view[:bytes_read].tobytes()
+    
+    def _set_read_buf(self, size: int) -> None:
+        """
+        Replace the read buffer, along with the views read() uses on it.
+        
+        The ctypes array and memoryview are made once per buffer rather than
+        on every read. The buffer stays a bytearray rather than an
+        array.array: both export the same memory to from_buffer, and the
+        bytearray needs no typecode.
+        """
+        self._read_buf = bytearray(size)
+        self._read_cbuf = (c_uint8 * size).from_buffer(self._read_buf)
+        self._read_view = memoryview(self._read_buf)
+    
+    def _read_all(self) -> bytes:
+        """Read until EOF, growing a single buffer as needed."""
+        result = bytearray(self.DEFAULT_BUFFER_SIZE)
+        total = 0
+        while True:
+            if total == len(result):
+                result += bytes(len(result))
+            bytes_read = self.readinto(memoryview(result)[total:])
+            if bytes_read == 0:
+                break
+            total += bytes_read
+        
+        del result[total:]
+        return bytes(result)
+    
+    def readinto(self, buf) -> int:
+        """
+        Read data from the stream directly into a caller-supplied buffer.
+        
+        Args:
+            buf: A writable bytes-like object (bytearray, memoryview, ...).
+                 Up to len(buf) bytes are read.
+            
+        Returns:
+            Number of bytes read; 0 at EOF.
+        """
         if not self._handle:
             raise CimplStreamError("Stream is closed", 0)
         
-        if size < 0:
-            size = 8192  # Default buffer size
+        view = memoryview(buf).cast('B')
+        size = len(view)
+        if size == 0:
+            return 0
         
-        buffer = (c_uint8 * size)()
-        bytes_read = _lib.cimpl_stream_read(self._handle, buffer, size)
-        _check_error(bytes_read, "cimpl_stream_read")
+        # Shares memory with buf, so the C side fills it in place
+        buffer = (c_uint8 * size).from_buffer(view)
+        bytes_read = self._c_read(self._handle, buffer, size)
+        if bytes_read < 0:
+            _raise_error("cimpl_stream_read")
         
-        return bytes(buffer[:bytes_read])
+        return bytes_read
     
-    def write(self, data: bytes) -> int:
+    def write(self, data) -> int:
         """
         Write data to the stream.
         
         Args:
-            data: Bytes to write.
+            data: A bytes-like object (bytes, bytearray, memoryview, ...).
             
         Returns:
             Number of bytes written.
@@ -290,9 +541,20 @@ class Stream:
         if not self._handle:
             raise CimplStreamError("Stream is closed", 0)
         
-        buffer = (c_uint8 * len(data)).from_buffer_copy(data)
-        bytes_written = _lib.cimpl_stream_write(self._handle, buffer, len(data))
-        _check_error(bytes_written, "cimpl_stream_write")
+        # Hand the C side the caller's memory rather than a copy of it
+        if isinstance(data, bytes):
+            buffer, size = data, len(data)
+        else:
+            view = memoryview(data).cast('B')
+            size = len(view)
+            if view.readonly:
+                buffer = view.tobytes()
+            else:
+                buffer = (c_uint8 * size).from_buffer(view)
+        
+        bytes_written = self._c_write(self._handle, buffer, size)
+        if bytes_written < 0:
+            _raise_error("cimpl_stream_write")
         
         return bytes_written
     
@@ -310,17 +572,13 @@ class Stream:
         if not self._handle:
             raise CimplStreamError("Stream is closed", 0)
         
-        if whence == os.SEEK_SET:
-            mode = SeekMode.START
-        elif whence == os.SEEK_CUR:
-            mode = SeekMode.CURRENT
-        elif whence == os.SEEK_END:
-            mode = SeekMode.END
-        else:
+        # Range check first: a negative whence would otherwise index from the end
+        if not 0 <= whence < len(_WHENCE_MAP):
             raise ValueError(f"Invalid whence value: {whence}")
         
-        new_pos = _lib.cimpl_stream_seek(self._handle, offset, mode)
-        _check_error(new_pos, "cimpl_stream_seek")
+        new_pos = self._c_seek(self._handle, offset, _WHENCE_MAP[whence])
+        if new_pos < 0:
+            _raise_error("cimpl_stream_seek")
         
         return new_pos
     
@@ -329,18 +587,19 @@ class Stream:
         if not self._handle:
             raise CimplStreamError("Stream is closed", 0)
         
-        result = _lib.cimpl_stream_flush(self._handle)
-        _check_error(result, "cimpl_stream_flush")
+        result = self._c_flush(self._handle)
+        if result < 0:
+            _raise_error("cimpl_stream_flush")
     
     def tell(self) -> int:
         """Get the current stream position."""
         return self.seek(0, os.SEEK_CUR)
     
     def close(self) -> None:
-        """Close the stream and free resources."""
+        """Close the stream, writing out any buffered data, and free resources."""
         if self._handle:
-            _lib.cimpl_free(self._handle)
             self._handle = None
+            self._finalizer()
     
     def __enter__(self):
         """Context manager entry."""
@@ -350,10 +609,6 @@ class Stream:
         """Context manager exit."""
         self.close()
         return False
-    
-    def __del__(self):
-        """Destructor to ensure cleanup."""
-        self.close()
 
 
 # Convenience function
@@ -6,9 +6,13 @@ This shows how to wrap Python file objects and use them with the
 cimpl_stream library.
 """
 
+import gc
 import io
 import os
 import sys
+import tempfile
+
+import cimpl_stream
 from cimpl_stream import Stream, CimplStreamError
 
 
@@ -96,6 +100,10 @@ def example_memory_stream():
     bytes_written = stream.write(message)
     print(f"   Wrote {bytes_written} bytes")
     
+    # The data is in the file object as soon as write() returns
+    assert buffer.getvalue() == message, buffer.getvalue()
+    print(f"   Buffer holds: '{buffer.getvalue().decode('utf-8')}'")
+    
     print("\n2. Reading from memory buffer...")
     pos = stream.seek(0)
     print(f"   Seeked to position {pos}")
@@ -115,6 +123,112 @@ def example_memory_stream():
     print("\n=== Memory stream example completed! ===\n")
 
 
+def example_buffer_api():
+    """Example using readinto, read-to-EOF and bytes-like writes."""
+    print("=== Buffer API Example ===\n")
+    
+    buffer = io.BytesIO()
+    stream = Stream(buffer)
+    
+    print("1. Writing bytes, bytearray and memoryview...")
+    assert stream.write(b"bytes,") == 6
+    assert stream.write(bytearray(b"bytearray,")) == 10
+    assert stream.write(memoryview(b"..memoryview")[2:]) == 10
+    assert buffer.getvalue() == b"bytes,bytearray,memoryview", buffer.getvalue()
+    print(f"   Buffer holds: '{buffer.getvalue().decode('utf-8')}'")
+    
+    print("\n2. Reading into a preallocated buffer...")
+    stream.seek(6)
+    target = bytearray(9)
+    bytes_read = stream.readinto(target)
+    print(f"   readinto filled {bytes_read} bytes: '{target.decode('utf-8')}'")
+    assert bytes_read == 9 and target == b"bytearray"
+    
+    view = memoryview(bytearray(4))
+    assert stream.readinto(view[1:]) == 3 and view[1:] == b",me"
+    
+    print("\n3. Reading to EOF with read(-1)...")
+    stream.seek(0)
+    data = stream.read(-1)
+    print(f"   Read {len(data)} bytes")
+    assert data == buffer.getvalue()
+    assert stream.read(-1) == b""
+    assert stream.readinto(bytearray(8)) == 0
+    
+    # Larger than one read chunk, so read() has to loop
+    big = os.urandom(3 * Stream.DEFAULT_BUFFER_SIZE + 17)
+    stream = Stream(io.BytesIO(big))
+    assert stream.read() == big
+    print(f"   Read {len(big)} bytes in chunks of {Stream.DEFAULT_BUFFER_SIZE}")
+    
+    print("\n=== Buffer API example completed! ===\n")
+
+
+def example_fd_stream():
+    """Example streaming a file descriptor directly, without Python callbacks."""
+    print("=== File Descriptor Stream Example ===\n")
+    
+    if not cimpl_stream._HAS_FD_STREAMS:
+        print("   File descriptor streams are not available on this platform")
+        print("\n=== File descriptor stream example skipped ===\n")
+        return
+    
+    with tempfile.TemporaryFile() as tmp:
+        print("1. Wrapping a raw FileIO...")
+        raw = io.FileIO(tmp.fileno(), 'r+', closefd=False)
+        stream = Stream(raw)
+        # A raw FileIO is read through its descriptor, so no callbacks
+        # are registered for it
+        assert id(stream) not in cimpl_stream._STREAM_REGISTRY
+        assert stream.write(b"written via the fd") == 18
+        stream.seek(0)
+        data = stream.read()
+        print(f"   Read back: '{data.decode('utf-8')}'")
+        assert data == b"written via the fd"
+        stream.close()
+        
+        print("\n2. Opening a stream with Stream.from_fd...")
+        stream = Stream.from_fd(tmp.fileno())
+        stream.seek(12)
+        data = stream.read(6)
+        print(f"   Read 6 bytes from position 12: '{data.decode('utf-8')}'")
+        assert data == b"the fd"
+        stream.close()
+        
+        # Closing the stream leaves the descriptor open
+        tmp.seek(0)
+        assert tmp.read() == b"written via the fd"
+    
+    print("\n=== File descriptor stream example completed! ===\n")
+
+
+def example_shared_callbacks():
+    """Example showing many streams sharing one set of callbacks."""
+    print("=== Shared Callbacks Example ===\n")
+    
+    print("1. Writing through several streams at once...")
+    buffers = [io.BytesIO() for _ in range(3)]
+    streams = [Stream(buffer) for buffer in buffers]
+    for i, stream in enumerate(streams):
+        stream.write(f"stream {i}".encode())
+    for i, buffer in enumerate(buffers):
+        assert buffer.getvalue() == f"stream {i}".encode(), buffer.getvalue()
+    print(f"   {len(streams)} streams each wrote to their own buffer")
+    assert all(id(stream) in cimpl_stream._STREAM_REGISTRY for stream in streams)
+    
+    print("\n2. Releasing the streams...")
+    streams[0].close()
+    assert id(streams[0]) not in cimpl_stream._STREAM_REGISTRY
+    # The registry holds weak references, so dropping the rest frees them
+    keys = [id(stream) for stream in streams]
+    del stream, streams
+    gc.collect()
+    assert not any(key in cimpl_stream._STREAM_REGISTRY for key in keys)
+    print("   Registry entries removed on close and on collection")
+    
+    print("\n=== Shared callbacks example completed! ===\n")
+
+
 def example_error_handling():
     """Example demonstrating error handling."""
     print("=== Error Handling Example ===\n")
@@ -153,6 +267,9 @@ def main():
     try:
         example_file_stream()
         example_memory_stream()
+        example_buffer_api()
+        example_fd_stream()
+        example_shared_callbacks()
         example_error_handling()
         
         print("="*60)
@@ -38,7 +38,7 @@ use std::io::{Read, Seek, SeekFrom, Write};
 
 use cimpl::{
     box_tracked, deref_mut_or_return_neg, ok_or_return, option_to_c_string, ptr_or_return_int,
-    ptr_or_return_null, Error,
+    ptr_or_return_null, CimplError as Error,
 };
 
 // ============================================================================
@@ -78,6 +78,14 @@ pub enum CimplStreamError {
 const ERROR_MAPPER: fn(&std::io::Error) -> (i32, &'static str) = 
     |_e| (CimplStreamError::IoOperation as i32, "IoError");
 
+/// Converts an I/O error into a cimpl Error using ERROR_MAPPER.
+///
+/// Neither type is defined in this crate, so a `From` impl is not possible.
+fn io_error(e: std::io::Error) -> Error {
+    let (code, prefix) = ERROR_MAPPER(&e);
+    Error::new(code, format!("{}: {}", prefix, e))
+}
+
 // ============================================================================
 // Stream Context and Callbacks
 // ============================================================================
@@ -238,6 +246,120 @@ pub extern "C" fn cimpl_stream_new(
     box_tracked!(stream)
 }
 
+// ============================================================================
+// File Descriptor Streams (Unix)
+// ============================================================================
+//
+// A stream over a raw file descriptor, with Rust-side callbacks that read and
+// write the descriptor directly. Callers whose stream is already an fd (a C
+// `open()`, a Python `FileIO`) skip their own callback layer entirely.
+//
+// The fd travels in the context pointer, offset by one so that fd 0 does not
+// become a NULL context.
+
+#[cfg(unix)]
+fn fd_to_context(fd: std::os::raw::c_int) -> *mut CimplStreamContext {
+    (fd as usize + 1) as *mut CimplStreamContext
+}
+
+/// Borrows the context's fd as a `File` that never closes it.
+#[cfg(unix)]
+unsafe fn fd_file(context: *mut CimplStreamContext) -> std::mem::ManuallyDrop<std::fs::File> {
+    use std::os::unix::io::FromRawFd;
+    let fd = (context as usize - 1) as std::os::raw::c_int;
+    std::mem::ManuallyDrop::new(std::fs::File::from_raw_fd(fd))
+}
+
+#[cfg(unix)]
+unsafe extern "C" fn fd_read(context: *mut CimplStreamContext, data: *mut u8, len: usize) -> isize {
+    let buf = std::slice::from_raw_parts_mut(data, len);
+    match fd_file(context).read(buf) {
+        Ok(n) => n as isize,
+        Err(_) => -1,
+    }
+}
+
+#[cfg(unix)]
+unsafe extern "C" fn fd_seek(
+    context: *mut CimplStreamContext,
+    offset: i64,
+    mode: CimplSeekMode,
+) -> i64 {
+    let from = match mode {
+        CimplSeekMode::Start if offset < 0 => return -1,
+        CimplSeekMode::Start => SeekFrom::Start(offset as u64),
+        CimplSeekMode::Current => SeekFrom::Current(offset),
+        CimplSeekMode::End => SeekFrom::End(offset),
+    };
+    match fd_file(context).seek(from) {
+        Ok(pos) => pos as i64,
+        Err(_) => -1,
+    }
+}
+
+#[cfg(unix)]
+unsafe extern "C" fn fd_write(
+    context: *mut CimplStreamContext,
+    data: *const u8,
+    len: usize,
+) -> isize {
+    let buf = std::slice::from_raw_parts(data, len);
+    match fd_file(context).write(buf) {
+        Ok(n) => n as isize,
+        Err(_) => -1,
+    }
+}
+
+#[cfg(unix)]
+unsafe extern "C" fn fd_flush(_context: *mut CimplStreamContext) -> i32 {
+    0 // Writes go straight to the descriptor; there is no buffer to flush
+}
+
+/// Creates a new stream that reads and writes a file descriptor directly.
+///
+/// # Parameters
+/// - `fd`: An open file descriptor
+///
+/// # Returns
+/// - Pointer to the new stream on success
+/// - NULL if `fd` is negative (check `cimpl_stream_last_error()` for details)
+///
+/// # Safety
+/// - The descriptor is borrowed, not owned: freeing the stream does not close it
+/// - The descriptor must stay open for the lifetime of the stream
+/// - The returned stream must be freed with `cimpl_free()` when done
+///
+/// # Example
+/// ```c
+/// int fd = open("data.bin", O_RDWR);
+/// CimplStream* stream = cimpl_stream_new_fd(fd);
+/// // Use the stream...
+/// cimpl_free(stream);
+/// close(fd);
+/// ```
+#[cfg(unix)]
+#[no_mangle]
+pub extern "C" fn cimpl_stream_new_fd(fd: std::os::raw::c_int) -> *mut CimplStream {
+    if fd < 0 {
+        Error::new(
+            CimplStreamError::InvalidHandle as i32,
+            format!("InvalidHandle: file descriptor {}", fd),
+        )
+        .set_last();
+        return std::ptr::null_mut();
+    }
+
+    let stream = CimplStream {
+        context: fd_to_context(fd),
+        reader: fd_read,
+        seeker: fd_seek,
+        writer: fd_write,
+        flusher: fd_flush,
+    };
+
+    box_tracked!(stream)
+}
+
 // ============================================================================
 // Stream Operations
 // ============================================================================
@@ -273,7 +395,7 @@ pub extern "C" fn cimpl_stream_read(
     // Create a safe slice from the raw pointer
     let buf = unsafe { std::slice::from_raw_parts_mut(buffer, len) };
 
-    ok_or_return!(s.read(buf), |bytes_read| bytes_read as isize, -1)
+    ok_or_return!(s.read(buf).map_err(io_error), |bytes_read| bytes_read as isize, -1)
 }
 
 /// Seeks to a position in the stream.
@@ -312,7 +434,7 @@ pub extern "C" fn cimpl_stream_seek(
         CimplSeekMode::End => SeekFrom::End(offset),
     };
 
-    ok_or_return!(s.seek(seek_from), |pos| pos as i64, -1)
+    ok_or_return!(s.seek(seek_from).map_err(io_error), |pos| pos as i64, -1)
 }
 
 /// Writes data to the stream.
@@ -345,7 +467,7 @@ pub extern "C" fn cimpl_stream_write(
 
     let buf = unsafe { std::slice::from_raw_parts(data, len) };
 
-    ok_or_return!(s.write(buf), |bytes_written| bytes_written as isize, -1)
+    ok_or_return!(s.write(buf).map_err(io_error), |bytes_written| bytes_written as isize, -1)
 }
 
 /// Flushes the stream, ensuring all buffered data is written.
@@ -367,7 +489,7 @@ pub extern "C" fn cimpl_stream_write(
 pub extern "C" fn cimpl_stream_flush(stream: *mut CimplStream) -> i32 {
     let s = deref_mut_or_return_neg!(stream, CimplStream);
 
-    ok_or_return!(s.flush(), |_| 0, -1)
+    ok_or_return!(s.flush().map_err(io_error), |_| 0, -1)
 }
 
 // ============================================================================
@@ -509,6 +631,56 @@ pub extern "C" fn cimpl_stream_clear_error() {
     Error::take_last();
 }
 
+/// Takes the last error, copying its message into a caller-supplied buffer.
+///
+/// Does the work of `cimpl_stream_error_code()`, `cimpl_stream_last_error()`,
+/// `cimpl_free()` and `cimpl_stream_clear_error()` in a single call, without
+/// handing an allocation back to the caller.
+///
+/// # Parameters
+/// - `buffer`: Receives the message, NUL-terminated (may be NULL if `capacity` is 0)
+/// - `capacity`: Size of `buffer` in bytes
+/// - `out_code`: Receives the error code, 0 if no error (may be NULL)
+///
+/// # Returns
+/// - Length of the full message in bytes, not counting the NUL; 0 if no error.
+///   If this is `>= capacity`, the message was truncated to `capacity - 1` bytes.
+///
+/// # Example
+/// ```c
+/// if (cimpl_stream_read(stream, buffer, len) < 0) {
+///     char message[256];
+///     int32_t code;
+///     cimpl_stream_take_error(message, sizeof(message), &code);
+///     fprintf(stderr, "Error %d: %s\n", code, message);
+/// }
+/// ```
+#[no_mangle]
+pub extern "C" fn cimpl_stream_take_error(
+    buffer: *mut std::os::raw::c_char,
+    capacity: usize,
+    out_code: *mut i32,
+) -> usize {
+    let code = Error::last_code();
+    let message = Error::take_last()
+        .map(|e| e.to_string())
+        .unwrap_or_default();
+
+    if !out_code.is_null() {
+        unsafe { *out_code = code };
+    }
+
+    if !buffer.is_null() && capacity > 0 {
+        let copied = message.len().min(capacity - 1);
+        unsafe {
+            std::ptr::copy_nonoverlapping(message.as_ptr(), buffer as *mut u8, copied);
+            *buffer.add(copied) = 0;
+        }
+    }
+
+    message.len()
+}
+
 // ============================================================================
 // Tests
 // ============================================================================
@@ -793,5 +965,85 @@ mod tests {
         cimpl_stream_clear_error();
         assert_eq!(cimpl_stream_error_code(), 0);
     }
+
+    #[cfg(unix)]
+    #[test]
+    fn test_fd_stream() {
+        use std::os::unix::io::AsRawFd;
+
+        let path = std::env::temp_dir().join(format!("cimpl_stream_fd_{}", std::process::id()));
+        let mut file = std::fs::OpenOptions::new()
+            .read(true)
+            .write(true)
+            .create(true)
+            .truncate(true)
+            .open(&path)
+            .unwrap();
+
+        let stream = cimpl_stream_new_fd(file.as_raw_fd());
+        assert!(!stream.is_null());
+
+        let write_data = b"Hello, fd!";
+        let bytes_written = cimpl_stream_write(stream, write_data.as_ptr(), write_data.len());
+        assert_eq!(bytes_written, write_data.len() as isize);
+        assert_eq!(cimpl_stream_flush(stream), 0);
+
+        assert_eq!(cimpl_stream_seek(stream, 7, CimplSeekMode::Start), 7);
+        let mut read_buf = [0u8; 16];
+        let bytes_read = cimpl_stream_read(stream, read_buf.as_mut_ptr(), read_buf.len());
+        assert_eq!(&read_buf[..bytes_read as usize], b"fd!");
+        assert_eq!(cimpl_stream_seek(stream, -1, CimplSeekMode::Start), -1);
+
+        cimpl::cimpl_free(stream as *mut std::ffi::c_void);
+
+        // Freeing the stream left the descriptor open
+        file.seek(SeekFrom::Start(0)).unwrap();
+        let mut contents = String::new();
+        file.read_to_string(&mut contents).unwrap();
+        assert_eq!(contents, "Hello, fd!");
+
+        drop(file);
+        let _ = std::fs::remove_file(&path);
+
+        assert!(cimpl_stream_new_fd(-1).is_null());
+        assert_eq!(
+            cimpl_stream_error_code(),
+            CimplStreamError::InvalidHandle as i32
+        );
+        cimpl_stream_clear_error();
+    }
+
+    #[test]
+    fn test_take_error() {
+        cimpl_stream_clear_error();
+
+        let null_stream: *mut CimplStream = std::ptr::null_mut();
+        assert_eq!(cimpl_stream_flush(null_stream), -1);
+        let expected_code = cimpl_stream_error_code();
+        assert_ne!(expected_code, 0);
+
+        // Message and code come back in one call, and the error is cleared
+        let mut buf = [0 as std::os::raw::c_char; 256];
+        let mut code = 0i32;
+        let len = cimpl_stream_take_error(buf.as_mut_ptr(), buf.len(), &mut code);
+        assert!(len > 0 && len < buf.len());
+        assert_eq!(code, expected_code);
+        let message = unsafe { std::ffi::CStr::from_ptr(buf.as_ptr()) };
+        assert_eq!(message.to_bytes().len(), len);
+        assert_eq!(cimpl_stream_error_code(), 0);
+
+        // Nothing left to take
+        let len = cimpl_stream_take_error(buf.as_mut_ptr(), buf.len(), &mut code);
+        assert_eq!(len, 0);
+        assert_eq!(code, 0);
+        assert_eq!(buf[0], 0);
+
+        // A short buffer gets a truncated, NUL-terminated prefix
+        assert_eq!(cimpl_stream_flush(null_stream), -1);
+        let mut small = [0x7f as std::os::raw::c_char; 4];
+        let len = cimpl_stream_take_error(small.as_mut_ptr(), small.len(), std::ptr::null_mut());
+        assert!(len >= small.len());
+        assert_eq!(small[3], 0);
+    }
 }
 